@@ -32,8 +32,8 @@ class Cdf(MakefilePackage):
         pass
 
     def build(self, spec, prefix):
-        """Build CDF with custom Makefile parameters."""
-        make("OS=linux", "ENV=gnu", "all")
+        """Build CDF, including the shared library NEP links against."""
+        make("OS=linux", "ENV=gnu", "SHARED=yes", "all")
 
     def install(self, spec, prefix):
         """Install CDF to specified prefix."""
@@ -8,104 +8,47 @@ for testing the format detection logic.
 
 import struct
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-def write_le_geotiff(filename):
-    """Create a minimal little-endian GeoTIFF file."""
-    with open(filename, 'wb') as f:
-        # TIFF header (little-endian)
-        f.write(b'II')  # Magic number (little-endian)
-        f.write(struct.pack('<H', 42))  # Version (classic TIFF)
-        f.write(struct.pack('<I', 8))  # IFD offset
-        
-        # IFD (Image File Directory)
-        f.write(struct.pack('<H', 2))  # Number of entries
-        
-        # Entry 1: ImageWidth (tag 256)
-        f.write(struct.pack('<H', 256))  # Tag
-        f.write(struct.pack('<H', 3))    # Type (SHORT)
-        f.write(struct.pack('<I', 1))    # Count
-        f.write(struct.pack('<I', 100))  # Value
-        
-        # Entry 2: GeoKeyDirectoryTag (tag 34735) - This makes it a GeoTIFF
-        f.write(struct.pack('<H', 34735))  # Tag
-        f.write(struct.pack('<H', 3))      # Type (SHORT)
-        f.write(struct.pack('<I', 4))      # Count
-        f.write(struct.pack('<I', 100))    # Offset to data
-        
-        # Next IFD offset (0 = no more IFDs)
-        f.write(struct.pack('<I', 0))
-        
-        # GeoKey data
-        f.write(struct.pack('<HHHH', 1, 1, 0, 0))
+# Structured TIFF files: (filename, description, byte order, IFD entries,
+# GeoKey data). Each IFD entry is (tag, type, count, value); tag 256 is
+# ImageWidth and tag 34735 is GeoKeyDirectoryTag, which makes it a GeoTIFF.
+SPECS = [
+    ('le_geotiff.tif', 'little-endian GeoTIFF', '<',
+     [(256, 3, 1, 100), (34735, 3, 4, 100)], (1, 1, 0, 0)),
+    ('be_geotiff.tif', 'big-endian GeoTIFF', '>',
+     [(256, 3, 1, 100), (34735, 3, 4, 100)], (1, 1, 0, 0)),
+    ('regular.tif', 'regular TIFF without GeoTIFF tags', '<',
+     [(256, 3, 1, 100)], None),
+]
 
-def write_be_geotiff(filename):
-    """Create a minimal big-endian GeoTIFF file."""
-    with open(filename, 'wb') as f:
-        # TIFF header (big-endian)
-        f.write(b'MM')  # Magic number (big-endian)
-        f.write(struct.pack('>H', 42))  # Version (classic TIFF)
-        f.write(struct.pack('>I', 8))   # IFD offset
-        
-        # IFD (Image File Directory)
-        f.write(struct.pack('>H', 2))  # Number of entries
-        
-        # Entry 1: ImageWidth (tag 256)
-        f.write(struct.pack('>H', 256))  # Tag
-        f.write(struct.pack('>H', 3))    # Type (SHORT)
-        f.write(struct.pack('>I', 1))    # Count
-        f.write(struct.pack('>I', 100))  # Value
-        
-        # Entry 2: GeoKeyDirectoryTag (tag 34735) - This makes it a GeoTIFF
-        f.write(struct.pack('>H', 34735))  # Tag
-        f.write(struct.pack('>H', 3))      # Type (SHORT)
-        f.write(struct.pack('>I', 4))      # Count
-        f.write(struct.pack('>I', 100))    # Offset to data
-        
-        # Next IFD offset (0 = no more IFDs)
-        f.write(struct.pack('>I', 0))
-        
-        # GeoKey data
-        f.write(struct.pack('>HHHH', 1, 1, 0, 0))
+# Malformed and non-TIFF files: (filename, description, contents).
+RAW_FILES = [
+    # Invalid magic number, valid version and IFD offset
+    ('corrupted.tif', 'corrupted header', b'XX\x2a\x00\x08\x00\x00\x00'),
+    # Only 4 bytes (incomplete header)
+    ('truncated.tif', 'truncated file', b'II\x2a\x00'),
+    ('not_tiff.txt', 'non-TIFF file', b'This is not a TIFF file.\n'),
+]
 
-def write_regular_tiff(filename):
-    """Create a minimal regular TIFF file without GeoTIFF tags."""
-    with open(filename, 'wb') as f:
-        # TIFF header (little-endian)
-        f.write(b'II')  # Magic number
-        f.write(struct.pack('<H', 42))  # Version
-        f.write(struct.pack('<I', 8))   # IFD offset
-        
-        # IFD with only standard TIFF tags (no GeoTIFF tags)
-        f.write(struct.pack('<H', 1))  # Number of entries
-        
-        # Entry 1: ImageWidth (tag 256)
-        f.write(struct.pack('<H', 256))  # Tag
-        f.write(struct.pack('<H', 3))    # Type (SHORT)
-        f.write(struct.pack('<I', 1))    # Count
-        f.write(struct.pack('<I', 100))  # Value
-        
-        # Next IFD offset
-        f.write(struct.pack('<I', 0))
+def _build_tiff(endian, entries, geokey_data):
+    """Return the bytes of a minimal classic TIFF with one IFD at offset 8."""
+    fmt = endian + 'HIH' + 'HHII' * len(entries) + 'I'
+    values = [42, 8, len(entries)]
+    for entry in entries:
+        values.extend(entry)
+    values.append(0)  # Next IFD offset (0 = no more IFDs)
+    if geokey_data:
+        fmt += 'HHHH'
+        values.extend(geokey_data)
+    buf = bytearray(b'II' if endian == '<' else b'MM')
+    buf += struct.pack(fmt, *values)
+    return bytes(buf)
 
-def write_corrupted_tiff(filename):
-    """Create a file with corrupted TIFF header."""
-    with open(filename, 'wb') as f:
-        # Invalid magic number
-        f.write(b'XX')
-        f.write(struct.pack('<H', 42))
-        f.write(struct.pack('<I', 8))
-
-def write_truncated_tiff(filename):
-    """Create a truncated TIFF file (< 8 bytes)."""
-    with open(filename, 'wb') as f:
-        # Only 4 bytes (incomplete header)
-        f.write(b'II')
-        f.write(struct.pack('<H', 42))
-
-def write_non_tiff(filename):
-    """Create a non-TIFF file."""
-    with open(filename, 'w') as f:
-        f.write("This is not a TIFF file.\n")
+def _write_file(path, contents):
+    """Write the contents of one test file."""
+    Path(path).write_bytes(contents)
 
 def main():
     """Generate all test files."""
@@ -114,23 +57,18 @@ def main():
     
     print("Generating test files...")
     
-    write_le_geotiff(os.path.join(data_dir, 'le_geotiff.tif'))
-    print("  Created le_geotiff.tif (little-endian GeoTIFF)")
-    
-    write_be_geotiff(os.path.join(data_dir, 'be_geotiff.tif'))
-    print("  Created be_geotiff.tif (big-endian GeoTIFF)")
-    
-    write_regular_tiff(os.path.join(data_dir, 'regular.tif'))
-    print("  Created regular.tif (regular TIFF without GeoTIFF tags)")
+    files = [(name, description, _build_tiff(endian, entries, geokey_data))
+             for name, description, endian, entries, geokey_data in SPECS]
+    files.extend(RAW_FILES)
     
-    write_corrupted_tiff(os.path.join(data_dir, 'corrupted.tif'))
-    print("  Created corrupted.tif (corrupted header)")
+    paths = [os.path.join(data_dir, name) for name, _, _ in files]
     
-    write_truncated_tiff(os.path.join(data_dir, 'truncated.tif'))
-    print("  Created truncated.tif (truncated file)")
+    # The files are independent, so overlap their open/write/close calls.
+    with ThreadPoolExecutor(max_workers=len(files)) as ex:
+        list(ex.map(_write_file, paths, [contents for _, _, contents in files]))
     
-    write_non_tiff(os.path.join(data_dir, 'not_tiff.txt'))
-    print("  Created not_tiff.txt (non-TIFF file)")
+    for name, description, _ in files:
+        print("  Created %s (%s)" % (name, description))
     
     print("All test files generated successfully!")
 